@@ -0,0 +1,87 @@
+# collision_kernels.py
+
+from jit import njit, HAVE_NUMBA
+
+if HAVE_NUMBA:
+    import numpy as np # numba depends on numpy, so it is always available alongside it
+
+
+def pack_aabbs(rects):
+    """
+    Packs rects into the (left, top, right, bottom) rows resolve() expects.
+    Args:
+        rects (iterable of pygame.Rect): The solid areas, e.g. platform rects.
+    Returns:
+        An (N, 4) int64 numpy array when numba is available (its compiled code needs an array),
+        otherwise a list of 4-tuples.
+    """
+    aabbs = [(r.left, r.top, r.right, r.bottom) for r in rects]
+    if HAVE_NUMBA:
+        return np.array(aabbs, dtype=np.int64).reshape(-1, 4)
+    return aabbs
+
+
+def select_aabbs(aabbs, indices):
+    """
+    The rows of packed AABBs (as returned by pack_aabbs) at the given indices, in the same format.
+    """
+    if HAVE_NUMBA:
+        return aabbs[indices]
+    return [aabbs[i] for i in indices]
+
+
+@njit(cache=True)
+def resolve_x(aabbs, px, rect_y, w, h, vx):
+    """
+    Horizontal pass of resolve(): the box is moved to x = int(px) (still at rect_y, its last drawn y)
+    and pushed out of the AABBs it overlaps there. Returns (x, px, vx), x being the box's pixel column
+    after the push-out.
+    """
+    # Hits are tested against the box position before any push-out
+    x0 = int(px) # Same pixel snapping as Player.update()
+    x = x0
+    for i in range(len(aabbs)):
+        row = aabbs[i]
+        left, top, right, bottom = row[0], row[1], row[2], row[3]
+        if x0 < right and x0 + w > left and rect_y < bottom and rect_y + h > top:
+            if vx > 0:
+                x = left - w
+            elif vx < 0:
+                x = right
+            px = float(x)
+            vx = 0.0
+    return x, px, vx
+
+@njit(cache=True)
+def resolve_y(aabbs, x, py, w, h, vy):
+    """
+    Vertical pass of resolve(): the box at pixel column x is moved to y = int(py) and pushed out of
+    the AABBs it overlaps there. Landing on top of an AABB sets on_ground. Returns (py, vy, on_ground).
+    """
+    y0 = int(py)
+    y = y0
+    on_ground = False
+    for i in range(len(aabbs)):
+        row = aabbs[i]
+        left, top, right, bottom = row[0], row[1], row[2], row[3]
+        if x < right and x + w > left and y0 < bottom and y0 + h > top:
+            if vy > 0:
+                y = top - h
+                on_ground = True
+            elif vy < 0:
+                y = bottom
+            py = float(y)
+            vy = 0.0
+    return py, vy, on_ground
+
+@njit(cache=True)
+def resolve(aabbs, px, py, rect_y, w, h, vx, vy):
+    """
+    Axis-separated collision response of a w x h box against static AABBs: resolve_x() at the box's
+    last drawn y, then resolve_y() at the pushed-out x. Same overlap rule as pygame.Rect.colliderect
+    (touching edges do not collide).
+    Returns (px, py, vx, vy, on_ground).
+    """
+    x, px, vx = resolve_x(aabbs, px, rect_y, w, h, vx)
+    py, vy, on_ground = resolve_y(aabbs, x, py, w, h, vy)
+    return px, py, vx, vy, on_ground
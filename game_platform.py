@@ -1,4 +1,4 @@
-# platform.py
+# game_platform.py
 
 import pygame
 from settings import  WHITE# Using a default color from settings
@@ -25,15 +25,13 @@ class Platform(pygame.sprite.Sprite):
             self.image.fill(WHITE) # Default color
         else:
             self.image.fill(color)
+        # Match the display's pixel format once so per-frame blits take SDL's fast copy path
+        self.image = self.image.convert()
         
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
 
-        # --- Add this line to create a mask for the platform ---
-        self.mask = pygame.mask.from_surface(self.image)
-        # --- End of new line ---
-
     # Platforms are static, so their update() method doesn't need to do anything
     # unless you want moving platforms later.
     # def update(self, *args):
@@ -0,0 +1,15 @@
+# jit.py
+
+# Optional numba support shared by the numeric kernels (player.py, collision_kernels.py).
+# numba is not required (pip install numba to enable it); without it @njit leaves the
+# decorated function untouched, so the kernels run as plain Python.
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -1,5 +1,6 @@
 # main.py
 
+import gc
 import pygame
 import os
 import settings # Import the whole settings module
@@ -7,9 +8,14 @@ import settings # Import the whole settings module
 # Import the classes from their respective files
 from spritesheet import Spritesheet
 from player import Player
-from platform import Platform
+from game_platform import Platform
 
 # --- Pygame Initialization ---
+# The renderer relies on pygame-ce only APIs (Surface.fblits), so fail early on legacy pygame.
+if not getattr(pygame, "IS_CE", False):
+    print("Error: This game requires pygame-ce. Install it with: pip install pygame-ce")
+    exit()
+
 try:
     pygame.init()
 except Exception as e:
@@ -19,7 +25,8 @@ except Exception as e:
 # --- Screen Setup ---
 # Dimensions are now derived in settings.py from BASE dimensions and GLOBAL_SCALE_FACTOR
 try:
-    screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), pygame.DOUBLEBUF)
+    screen = pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT), pygame.DOUBLEBUF,
+                                     vsync=settings.VSYNC)
     pygame.display.set_caption("Sorcery Game - Recreated")
 except pygame.error as e:
     print(f"Error setting up the screen: {e}")
@@ -27,6 +34,17 @@ except pygame.error as e:
     exit()
 
 clock = pygame.time.Clock()
+# clock.tick() sleeps via SDL_Delay (1ms granularity, may oversleep); tick_busy_loop() spins for exact pacing
+# at the cost of a busy CPU core. Chosen once here from settings.PRECISE_PACING.
+clock_tick = clock.tick_busy_loop if settings.PRECISE_PACING else clock.tick
+
+# --- Event Filtering ---
+# The game loop only reacts to these event types; they are fetched by type so SDL filters the queue
+# in C and no Python Event objects are built for anything else.
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE]
+# High-volume input the game never uses is blocked from entering the queue at all.
+pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                          pygame.MOUSEWHEEL, pygame.ACTIVEEVENT])
 
 # --- Font for Info Panel ---
 info_font = None
@@ -43,6 +61,8 @@ except Exception as e:
 
 # Animation data for the wizard
 # 'w' and 'h' should be the NATIVE (unscaled) dimensions of the sprite on the spritesheet
+# (An entry can instead be { "mirror_from": "<other animation>" } to reuse that animation's frames flipped
+# horizontally; the wizard's left and right walk cycles are drawn differently, so both are cut from the sheet.)
 wizard_animations_data = {
     "walk_left":  { "x": 0,   "y": 75, "w": settings.PLAYER_SPRITE_WIDTH, "h": settings.PLAYER_SPRITE_HEIGHT, "count": 4, "spacing": 1},
     "idle_front": { "x": 100, "y": 75, "w": settings.PLAYER_SPRITE_WIDTH, "h": settings.PLAYER_SPRITE_HEIGHT, "count": 4, "spacing": 1},
@@ -64,8 +84,9 @@ except Exception as e:
     exit()
 
 # --- Create Sprite Groups ---
-all_sprites = pygame.sprite.Group()
 platforms = pygame.sprite.Group()
+# Sprites that actually change each frame; static platforms are only drawn, never updated
+updatable = []
 
 # --- Create Player Instance ---
 wizard = None
@@ -83,7 +104,7 @@ try:
         print("CRITICAL: Player object created, but its animations dictionary is empty.")
         raise ValueError("Player animations not loaded.")
 
-    all_sprites.add(wizard)
+    updatable.append(wizard) # Player is not a pygame Sprite; it is updated from this list and drawn via draw_list
 
 except ValueError as ve:
     print(ve)
@@ -121,20 +142,44 @@ if wizard: # Only create platforms if player exists
         
         platform = Platform(pixel_x, pixel_y, pixel_width, pixel_height, color)
         platforms.add(platform)
-        all_sprites.add(platform)
 else:
     print("Skipping platform creation as player failed to initialize.")
 
+# --- Draw List ---
+# (surface, rect) pairs handed to screen.fblits() every frame. Platforms are static, so only the
+# wizard's entry is refreshed per frame; it is kept last so the wizard is drawn on top.
+draw_list = [(platform.image, platform.rect) for platform in platforms]
+draw_list.append(wizard.get_blit_pair())
+
 
 # --- Game State Variables for Info Panel ---
 current_location = "in the woods" # Example
 carrying_item = "nothing"    # Example
 energy_level = 99            # Example
 
+# Info panel background prepared once in the display format; drawing the panel starts with a plain blit of it
+_panel_bg = pygame.Surface((settings.SCREEN_WIDTH, settings.INFO_PANEL_HEIGHT)).convert()
+_panel_bg.fill(settings.INFO_PANEL_BG_COLOR)
+
+# Rendered info panel lines keyed by their text. The strings change rarely (and only take a handful of
+# distinct values), so each line is rasterized once and the cached surface is re-blitted afterwards.
+_text_cache = {}
+
+def _cached_render(text):
+    text_surface = _text_cache.get(text)
+    if text_surface is None:
+        text_surface = info_font.render(text, True, settings.INFO_PANEL_TEXT_COLOR).convert_alpha()
+        _text_cache[text] = text_surface
+    return text_surface
+
 def draw_info_panel(surface):
+    # Settings read once per call instead of once per text line
+    panel_y = settings.INFO_PANEL_Y_START
+    margin_x = settings.TEXT_MARGIN_X
+    line_spacing = settings.LINE_SPACING
+
     # Draw background for info panel
-    info_panel_rect = pygame.Rect(0, settings.INFO_PANEL_Y_START, settings.SCREEN_WIDTH, settings.INFO_PANEL_HEIGHT)
-    pygame.draw.rect(surface, settings.INFO_PANEL_BG_COLOR, info_panel_rect)
+    surface.blit(_panel_bg, (0, panel_y))
 
     # Text lines
     line1_text = f"you are {current_location},"
@@ -143,63 +188,92 @@ def draw_info_panel(surface):
 
     texts_to_render = [line1_text, line2_text, line3_text]
     # Margins and spacing are now scaled in settings.py
-    current_y = settings.INFO_PANEL_Y_START + settings.TEXT_MARGIN_Y
+    current_y = panel_y + settings.TEXT_MARGIN_Y
 
     for text_content in texts_to_render:
         if info_font:
-            text_surface = info_font.render(text_content, True, settings.INFO_PANEL_TEXT_COLOR)
-            surface.blit(text_surface, (settings.TEXT_MARGIN_X, current_y))
-            current_y += text_surface.get_height() + settings.LINE_SPACING
+            text_surface = _cached_render(text_content)
+            surface.blit(text_surface, (margin_x, current_y))
+            current_y += text_surface.get_height() + line_spacing
         else: 
-            pygame.draw.rect(surface, (255,0,0), (settings.TEXT_MARGIN_X, current_y, 200, 20)) # Fallback
-            current_y += 20 + settings.LINE_SPACING
+            pygame.draw.rect(surface, (255,0,0), (margin_x, current_y, 200, 20)) # Fallback
+            current_y += 20 + line_spacing
 
 
 # --- Game Loop ---
 running = True
+# The first frame (and any frame after the window was exposed) repaints everything;
+# afterwards only the wizard's dirty rectangle is pushed to the display.
+full_redraw = True
+prev_rect = wizard.rect.copy()
 # frame_count = 0 # Not strictly needed unless for specific debug/timing
 
+# Names used every frame, bound once so the loop skips the module attribute lookups
+event_get = pygame.event.get
+event_clear = pygame.event.clear
+display_flip = pygame.display.flip
+display_update = pygame.display.update
+QUIT, KEYDOWN, VIDEOEXPOSE, K_ESCAPE = pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE, pygame.K_ESCAPE
+FPS = settings.FPS
+BLACK = settings.BLACK
+
+# Garbage collection pacing: the automatic cycle collector can kick in mid-frame, so (when enabled in
+# settings) it is switched off and a full collection runs at a fixed frame interval instead.
+gc_interval = settings.GC_COLLECT_INTERVAL_FRAMES
+frames_since_gc = 0
+if gc_interval:
+    gc.collect() # Start from a clean heap after loading
+    gc.disable()
+
 while running:
-    dt = clock.tick(settings.FPS) / 1000.0
+    dt = clock_tick(FPS) / 1000.0
     # frame_count += 1
+    if gc_interval:
+        frames_since_gc += 1
+        if frames_since_gc >= gc_interval:
+            gc.collect()
+            frames_since_gc = 0
 
     # Event Handling
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
+    for event in event_get(HANDLED_EVENTS):
+        if event.type == QUIT:
             running = False
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
+        if event.type == KEYDOWN:
+            if event.key == K_ESCAPE:
                 running = False
             # Add other key events here if needed (e.g., for animation speed testing)
+        if event.type == VIDEOEXPOSE:
+            full_redraw = True
+    # Drop any remaining (unhandled) event types without pumping again, so they can't pile up in the queue
+    event_clear(pump=False)
     
     # Update Game State
-    if wizard is not None:
-        # The Group.update() method will call wizard.update(dt, platforms)
-        # because Player.update is defined to accept these arguments.
-        all_sprites.update(dt, platforms)
-    else:
-        print("Error: wizard object is None, cannot update.")
-        # running = False # Optionally stop the game if critical
+    # No per-frame wizard check: every startup failure above exits, so the wizard always exists here.
+    # Only active sprites are updated (platforms have no update logic), avoiding a dispatch per static sprite.
+    for sprite in updatable:
+        sprite.update(dt, platforms)
 
     # Draw / Render
-    # 1. Fill the entire screen (this will be the background for the game area too)
-    screen.fill(settings.BLACK) # Or settings.SKY_BLUE for the game area if preferred
-
-    # 2. Draw all game sprites (player, platforms) onto the screen
-    # These sprites are positioned within the GAME_AREA_WIDTH and GAME_AREA_HEIGHT
-    if wizard is not None:
-        all_sprites.draw(screen)
+    draw_list[-1] = wizard.get_blit_pair() # Animation may have swapped the image (the rect is resized in place)
+    if full_redraw:
+        # 1. Repaint the whole window: background, all game sprites (player, platforms)
+        #    and the info panel at the bottom
+        screen.fill(BLACK) # Or settings.SKY_BLUE for the game area if preferred
+        # Batched C-level blit of every sprite (what pygame-ce's Group.draw does internally)
+        screen.fblits(draw_list)
+        draw_info_panel(screen)
+        display_flip()
+        full_redraw = False
     else:
-        # Fallback rendering if player missing
-        font = pygame.font.Font(None, 36) # A generic font for error message
-        text_surface = font.render("Error: Player missing. Cannot draw game.", True, settings.WHITE)
-        text_rect = text_surface.get_rect(center=(settings.SCREEN_WIDTH/2, settings.SCREEN_HEIGHT/2))
-        screen.blit(text_surface, text_rect)
-        
-    # 3. Draw Info Panel on top of everything at the bottom
-    draw_info_panel(screen)
-        
-    pygame.display.flip()
+        # 2. Platforms are static and the wizard is clamped to the game area, so only the
+        #    region covered by the wizard last frame and this frame needs repainting.
+        dirty_rect = prev_rect.union(wizard.rect)
+        screen.fill(BLACK, dirty_rect)
+        screen.set_clip(dirty_rect) # Platforms overlapping the dirty area are redrawn, the rest is clipped away
+        screen.fblits(draw_list)
+        screen.set_clip(None)
+        display_update(dirty_rect)
+    prev_rect = wizard.rect.copy()
 
 # --- Cleanup ---
 pygame.quit()
@@ -0,0 +1,51 @@
+# physics.py
+
+# Player movement as plain-number kernels (no pygame objects), compiled by numba when it is installed.
+# Player.update() feeds move() the key states, resolves collisions through its SpatialHash and clamps
+# with clamp_to_bounds() before writing the result back.
+
+from jit import njit # numba's @njit when installed, otherwise a no-op decorator
+
+@njit(cache=True)
+def integrate(px, py, vx, vy, dt):
+    """Advance a position by velocity * dt. Returns (px, py)."""
+    return px + vx * dt, py + vy * dt
+
+@njit(cache=True)
+def clamp_to_bounds(px, py, vx, vy, on_ground, bound_w, bound_h, rect_w, rect_h):
+    """
+    Keep a rect of size (rect_w, rect_h) at (px, py) inside (0, 0, bound_w, bound_h),
+    zeroing velocity on an axis that was clamped. Pushing through the bottom edge counts as
+    standing on ground. Returns (px, py, vx, vy, on_ground).
+    """
+    max_x = float(bound_w - rect_w)
+    max_y = float(bound_h - rect_h)
+    # min/max instead of a branch per edge: the common in-bounds case takes no branch at all
+    clamped_x = min(max(px, 0.0), max_x)
+    clamped_y = min(max(py, 0.0), max_y)
+    if clamped_x != px:
+        vx = 0.0
+    if clamped_y != py:
+        vy = 0.0
+        if py > max_y:
+            on_ground = True
+    return clamped_x, clamped_y, vx, vy, on_ground
+
+@njit(cache=True)
+def move(px, py, dir_x, dir_y, on_ground, speed, gravity, dt):
+    """
+    Velocity from the input direction (dir_x, dir_y are -1/0/1 for left/none/right and up/none/down)
+    and integration of a body at (px, py). Collision response (SpatialHash.resolve) and
+    clamp_to_bounds() follow in Player.update().
+    Returns (px, py, vx, vy).
+    """
+    vx = dir_x * speed
+    if dir_y:
+        vy = dir_y * speed # Fly up / down
+    elif on_ground:
+        vy = 0.0 # Prevent gravity from building up while standing on a platform
+    else:
+        vy = gravity # Default to applying gravity
+
+    px, py = integrate(px, py, vx, vy, dt)
+    return px, py, vx, vy
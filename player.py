@@ -2,13 +2,98 @@
 
 import pygame
 import settings # Import the whole settings module to access its constants
+from enum import IntEnum
+
+from jit import njit # numba's @njit when installed, otherwise a no-op decorator
+from physics import move as _physics_move, clamp_to_bounds as _clamp_to_bounds
+from spatial_hash import SpatialHash
+
+# Key codes bound once at import so the per-frame input code avoids pygame module attribute lookups
+_K_LEFT = pygame.K_LEFT
+_K_RIGHT = pygame.K_RIGHT
+_K_UP = pygame.K_UP
+_K_DOWN = pygame.K_DOWN
+
+# Movement direction for each packed key state (bit 0: left, 1: right, 2: up, 3: down), as -1/0/1 for
+# left/none/right and up/none/down; opposite keys cancel out. Indexing these replaces the sign arithmetic.
+_DIR_X_FROM_BITS = tuple(((bits >> 1) & 1) - (bits & 1) for bits in range(16))
+_DIR_Y_FROM_BITS = tuple(((bits >> 3) & 1) - ((bits >> 2) & 1) for bits in range(16))
+
+class AnimState(IntEnum):
+    """
+    Animation states of the player's state machine, used as indices into Player.animations_list.
+    """
+    IDLE = 0
+    WALK_LEFT = 1
+    WALK_RIGHT = 2
+
+# Name of each AnimState's entry in the animation data, indexed by state
+ANIM_STATE_NAMES = ("idle_front", "walk_left", "walk_right")
+
+# Values read by the per-frame code, bound once at import instead of looked up on the enum/settings each frame.
+# The states are stored as plain ints so current_anim_idx only ever holds one type (it starts as -1).
+_IDLE, _WALK_LEFT, _WALK_RIGHT = int(AnimState.IDLE), int(AnimState.WALK_LEFT), int(AnimState.WALK_RIGHT)
+# AnimState by horizontal direction + 1 (0: left, 1: none, 2: right). Vertical movement never changes the
+# animation (flying, falling and standing all show idle_front), so no y axis is needed in the table.
+_ANIM_LUT = (_WALK_LEFT, _IDLE, _WALK_RIGHT)
+_VEL_THR = settings.PLAYER_ANIMATION_VELOCITY_THRESHOLD # Already scaled in settings.py
+_SCREEN_WIDTH = settings.SCREEN_WIDTH
+_get_pressed = pygame.key.get_pressed
+
+# Placeholder images shown when animations fail to load, keyed by (size, color). Created on first
+# use and shared by every Player, so spawning with broken animation data doesn't allocate a surface.
+_fallback_surfaces = {}
+
+def _fallback_surface(size, color):
+    surface = _fallback_surfaces.get((size, color))
+    if surface is None:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(color)
+        _fallback_surfaces[(size, color)] = surface
+    return surface
+
+# --- Animation kernel ---
+# Pure number crunching only (no pygame objects), so numba can compile it when it is installed.
+# The movement kernels live in physics.py.
+
+@njit(cache=True)
+def _tick_anim(ticks, ticks_per_frame, frame_index, frame_count):
+    """Advance the animation tick counter, wrapping the frame index. Returns (ticks, frame_index)."""
+    ticks += 1
+    if ticks >= ticks_per_frame:
+        ticks = 0
+        frame_index += 1
+        if frame_index >= frame_count: # Compare-and-reset is cheaper than a modulo
+            frame_index = 0
+    return ticks, frame_index
+
+
+class Player:
+    """
+    The player-controlled wizard. A plain slotted class rather than a pygame.sprite.Sprite: it is never
+    put in a sprite Group (the game loop updates it from a list and draws it via get_blit_pair()), so
+    Sprite's group bookkeeping and its property-based image/rect would only add overhead.
+    """
+    # Loaded animations shared by all Players built from the same spritesheet and animation data:
+    # (id(spritesheet), id(animation_frames_data)) -> (spritesheet, animation_frames_data, animations,
+    # animation_sizes). The entry keeps both key objects alive, so their ids can't be reused meanwhile.
+    _animations_cache = {}
+
+    # Fixed attribute layout: no per-instance __dict__, and attribute access goes through slots
+    __slots__ = (
+        'spritesheet', 'animations', 'animation_sizes', 'animations_list',
+        'native_sprite_width', 'native_sprite_height', 'scaled_sprite_width', 'scaled_sprite_height',
+        'current_anim_idx', 'current_animation_name', 'current_frames', '_frame_count', 'current_frame_index',
+        'animation_ticks_per_frame', 'ticks_since_last_frame_change',
+        '_px', '_py', '_vx', '_vy', 'speed_pps', 'gravity_pps', 'is_on_ground', '_platform_cache',
+        'image', 'rect',
+    )
 
-class Player(pygame.sprite.Sprite):
     def __init__(self, spritesheet_obj, animation_frames_data, initial_animation, position=(100,100),
                  animation_ticks_per_frame=settings.PLAYER_ANIMATION_TICKS_PER_FRAME):
-        super().__init__()
         self.spritesheet = spritesheet_obj
         self.animations = {}
+        self.animation_sizes = {} # Frame (width, height) per animation; all frames of one animation share a size
         # self.scale_factor = settings.PLAYER_SCALE_FACTOR # Old: Replaced by direct use of GLOBAL_SCALE_FACTOR
 
         # Native sprite dimensions (these are unscaled)
@@ -20,39 +105,80 @@ class Player(pygame.sprite.Sprite):
         self.scaled_sprite_height = self.native_sprite_height * settings.GLOBAL_SCALE_FACTOR
 
         self.load_animations(animation_frames_data)
+        # Frame tuples indexed by AnimState (empty tuple when the animation data lacks that state)
+        self.animations_list = [self.animations.get(name) or () for name in ANIM_STATE_NAMES]
+        self.current_anim_idx = -1 # AnimState being played, -1 until the state machine picks one
 
         self.current_animation_name = None
-        self.current_frames = []
+        self.current_frames = ()
+        self._frame_count = 0 # len(self.current_frames), cached whenever the frame list changes
         self.current_frame_index = 0
         
         self.animation_ticks_per_frame = animation_ticks_per_frame
         self.ticks_since_last_frame_change = 0
 
-        self.position = pygame.math.Vector2(position) # Float-based position
-        self.velocity = pygame.math.Vector2(0, 0)
+        # Float-based position and velocity kept as plain scalars: the per-frame update only ever
+        # needs the x/y components, and scalar math avoids temporary Vector2 objects.
+        self._px, self._py = float(position[0]), float(position[1])
+        self._vx = self._vy = 0.0
         
-        self.speed_pps = settings.PLAYER_SPEED_PPS
-        self.gravity_pps = settings.PLAYER_GRAVITY_PPS
+        # Floats even if configured as ints, so velocities never switch between int and float
+        self.speed_pps = float(settings.PLAYER_SPEED_PPS)
+        self.gravity_pps = float(settings.PLAYER_GRAVITY_PPS)
 
         self.is_on_ground = False # Will be set by collision logic
+        self._platform_cache = None # (platforms group, platform count, SpatialHash), see _platform_hash()
 
-        self.image = None 
-        self.rect = None 
+        # image and rect are guaranteed to exist from here on (the per-frame code relies on it):
+        # start from a fallback image using scaled dimensions, replaced below by the initial animation.
+        self.image = _fallback_surface((self.scaled_sprite_width, self.scaled_sprite_height), (255,0,0,128)) # Red semi-transparent
+        self.rect = self.image.get_rect(topleft=position)
         if initial_animation and self.animations.get(initial_animation):
             self.set_animation(initial_animation) 
         else:
             print(f"Warning: Initial animation '{initial_animation}' failed for Player.")
-            # Create a fallback image using scaled dimensions
-            self.image = pygame.Surface([self.scaled_sprite_width, self.scaled_sprite_height], pygame.SRCALPHA)
-            self.image.fill((255,0,0,128)) # Red semi-transparent
-            self.rect = self.image.get_rect(topleft=position)
             if not self.animations: print("CRITICAL: Player animations empty after init fallback.")
 
+    # Vector2 views of the scalar position/velocity for code outside the per-frame update
+    # (e.g. spawning/teleporting). Each read builds a new Vector2 snapshot.
+    @property
+    def position(self):
+        return pygame.math.Vector2(self._px, self._py)
+
+    @position.setter
+    def position(self, value):
+        self._px, self._py = float(value[0]), float(value[1])
+        # Keep the rect in step and drop the ground contact, so the next update() moves the player
+        # from here instead of taking the standing-still shortcut
+        self.rect.topleft = (int(self._px), int(self._py))
+        self.is_on_ground = False
+
+    @property
+    def velocity(self):
+        return pygame.math.Vector2(self._vx, self._vy)
+
+    @velocity.setter
+    def velocity(self, value):
+        self._vx, self._vy = float(value[0]), float(value[1])
+
     def load_animations(self, animation_frames_data):
         if not animation_frames_data: 
             print("CRITICAL: animation_frames_data empty in Player.load_animations.")
             return
+        cache_key = (id(self.spritesheet), id(animation_frames_data))
+        cached = Player._animations_cache.get(cache_key)
+        if cached is not None:
+            # Frames are never modified after loading (blits only read them), so they can be shared
+            self.animations, self.animation_sizes = cached[2], cached[3]
+            return
+        # Entries with "mirror_from" reuse another animation's frames flipped horizontally instead of cutting
+        # and scaling their own from the sheet, so they are built after the others
+        mirrors = {}
         for name, data in animation_frames_data.items():
+            mirror_source = data.get("mirror_from")
+            if mirror_source is not None:
+                mirrors[name] = mirror_source
+                continue
             # data["w"] and data["h"] should be the native (unscaled) dimensions from spritesheet
             # e.g., 24x24 for the player
             native_w = data.get("w", self.native_sprite_width) # Use data if provided, else default
@@ -65,15 +191,53 @@ class Player(pygame.sprite.Sprite):
                 data.get("spacing", 0), 
                 scale=settings.GLOBAL_SCALE_FACTOR # Apply global scaling
             )
-            if not frames: 
-                print(f"Warning: No frames loaded for '{name}' in Player.load_animations.")
-            self.animations[name] = frames
+            self._store_animation(name, frames)
+        for name in mirrors:
+            self._mirror_animation(name, mirrors, ())
         if not self.animations: 
             print("CRITICAL: Player animations still empty after loading.")
+        Player._animations_cache[cache_key] = (self.spritesheet, animation_frames_data,
+                                               self.animations, self.animation_sizes)
+
+    def _store_animation(self, name, frames):
+        if not frames: 
+            print(f"Warning: No frames loaded for '{name}' in Player.load_animations.")
+        # Frames are already converted to the display format by Spritesheet.get_image();
+        # stored as a tuple since an animation's frames never change after loading
+        self.animations[name] = tuple(frames)
+        if frames:
+            self.animation_sizes[name] = frames[0].get_size()
+
+    def _mirror_animation(self, name, mirrors, chain):
+        """
+        Build the "mirror_from" animation `name` (mirrors maps each such entry to its source), first
+        building its source when that is itself a mirror. `chain` holds the mirrors waiting on this one,
+        to catch cycles. Returns the frames.
+        """
+        frames = self.animations.get(name)
+        if frames is not None:
+            return frames
+        source = mirrors[name]
+        if source in mirrors:
+            if source in chain or source == name:
+                print(f"Warning: '{name}' mirrors '{source}', which mirrors it back, in Player.load_animations.")
+                source_frames = ()
+            else:
+                source_frames = self._mirror_animation(source, mirrors, chain + (name,))
+        else:
+            source_frames = self.animations.get(source)
+            if source_frames is None:
+                print(f"Warning: '{name}' mirrors unknown animation '{source}' in Player.load_animations.")
+                source_frames = ()
+        # flip() keeps the source's (display) pixel format, so no further conversion is needed
+        frames = [pygame.transform.flip(frame, True, False) for frame in source_frames]
+        self._store_animation(name, frames)
+        return self.animations[name]
 
     def set_animation(self, animation_name):
         if self.current_animation_name == animation_name and self.current_frames: 
             return
+        self.current_anim_idx = -1 # Selected by name; the next update_animation() re-syncs the state
         if not self.animations: 
             print(f"CRITICAL: No animations loaded when trying to set '{animation_name}'.")
             return
@@ -92,11 +256,10 @@ class Player(pygame.sprite.Sprite):
                     break 
             else: 
                 print("CRITICAL: No valid animations available for fallback in set_animation.")
-                self.image = pygame.Surface([self.scaled_sprite_width, self.scaled_sprite_height], pygame.SRCALPHA)
-                self.image.fill((255,255,0,128)) # Yellow
-                if self.rect is None: self.rect = self.image.get_rect(topleft=self.position)
-                else: self.rect.size = self.image.get_size()
-                self.current_frames = []
+                self.image = _fallback_surface((self.scaled_sprite_width, self.scaled_sprite_height), (255,255,0,128)) # Yellow
+                self.rect.size = self.image.get_size()
+                self.current_frames = ()
+                self._frame_count = 0
                 self.current_animation_name = animation_name 
                 self.current_frame_index = 0
                 self.ticks_since_last_frame_change = 0
@@ -105,171 +268,124 @@ class Player(pygame.sprite.Sprite):
             self.current_animation_name = animation_name
             self.current_frames = target_frames
         
+        self._frame_count = len(self.current_frames)
         self.current_frame_index = 0
         self.ticks_since_last_frame_change = 0
             
         if not self.current_frames:
             print(f"CRITICAL: current_frames for '{self.current_animation_name}' is unexpectedly empty after assignment.")
-            self.image = pygame.Surface([self.scaled_sprite_width, self.scaled_sprite_height], pygame.SRCALPHA)
-            self.image.fill((255,0,255,128)) # Magenta
-            if self.rect is None: self.rect = self.image.get_rect(topleft=self.position)
-            else: self.rect.size = self.image.get_size()
+            self.image = _fallback_surface((self.scaled_sprite_width, self.scaled_sprite_height), (255,0,255,128)) # Magenta
+            self.rect.size = self.image.get_size()
             return
 
-        new_image = self.current_frames[self.current_frame_index]
-        if self.rect is not None:
-            current_center = self.rect.center
-            self.image = new_image
-            self.rect = self.image.get_rect(center=current_center)
-        else: 
-            self.image = new_image
-            self.rect = self.image.get_rect(topleft=self.position)
-
-    def handle_input_and_movement(self, dt):
-        keys = pygame.key.get_pressed()
-        
-        moving_left = keys[pygame.K_LEFT]
-        moving_right = keys[pygame.K_RIGHT]
-        
-        target_horizontal_velocity = 0
-        if moving_left and not moving_right: 
-            target_horizontal_velocity = -self.speed_pps
-        elif moving_right and not moving_left: 
-            target_horizontal_velocity = self.speed_pps
-        self.velocity.x = target_horizontal_velocity
-
-        current_vy = self.gravity_pps # Default to applying gravity
-        
-        if keys[pygame.K_UP]: 
-            current_vy = -self.speed_pps # Fly up
-        elif keys[pygame.K_DOWN]: 
-            current_vy = self.speed_pps # Fly down
-        
-        if self.is_on_ground and not keys[pygame.K_UP] and not keys[pygame.K_DOWN]:
-            self.velocity.y = 0 
-        else:
-            self.velocity.y = current_vy
-        
-        self.position.x += self.velocity.x * dt
-        self.position.y += self.velocity.y * dt
+        # Resize the existing rect around its center instead of allocating a new one with get_rect()
+        current_center = self.rect.center
+        self.image = self.current_frames[self.current_frame_index]
+        self.rect.size = self.animation_sizes[self.current_animation_name]
+        self.rect.center = current_center
 
-    def handle_platform_collisions(self, platforms):
-        if self.rect is None: 
-            if self.image: 
-                self.rect = self.image.get_rect()
-            else: 
-                # Fallback rect if image is also None (should be rare)
-                self.rect = pygame.Rect(0,0, self.scaled_sprite_width, self.scaled_sprite_height)
-        
-        self.rect.x = round(self.position.x)
-        
-        hit_list_x = pygame.sprite.spritecollide(self, platforms, False)
-        for platform_hit in hit_list_x:
-            if self.velocity.x > 0: 
-                self.rect.right = platform_hit.rect.left
-            elif self.velocity.x < 0: 
-                self.rect.left = platform_hit.rect.right
-            self.position.x = float(self.rect.x) 
-            self.velocity.x = 0 
-
-        self.rect.y = round(self.position.y)
-        previous_is_on_ground = self.is_on_ground
-        self.is_on_ground = False 
-
-        hit_list_y = pygame.sprite.spritecollide(self, platforms, False)
-        for platform_hit in hit_list_y:
-            if self.velocity.y > 0: 
-                self.rect.bottom = platform_hit.rect.top
-                self.is_on_ground = True
-            elif self.velocity.y < 0: 
-                self.rect.top = platform_hit.rect.bottom
-            self.position.y = float(self.rect.y)
-            self.velocity.y = 0 
-
-    def apply_screen_boundaries(self):
-        if self.rect is None: 
-            return # Should have a rect by now
-
-        # Using scaled dimensions directly from self.rect which should be correctly sized
-        current_rect_width = self.rect.width
-        current_rect_height = self.rect.height
-
-        # Clamp X position (Horizontal bounds use SCREEN_WIDTH from settings)
-        if self.position.x < 0:
-            self.position.x = 0
-            if self.velocity.x < 0: self.velocity.x = 0
-        elif self.position.x + current_rect_width > settings.SCREEN_WIDTH: # Use scaled SCREEN_WIDTH
-            self.position.x = settings.SCREEN_WIDTH - current_rect_width
-            if self.velocity.x > 0: self.velocity.x = 0
-        
-        # Clamp Y position (Vertical bounds use GAME_AREA_HEIGHT from settings)
-        if self.position.y < 0: # Top of the game area
-            self.position.y = 0
-            if self.velocity.y < 0: self.velocity.y = 0 
-        elif self.position.y + current_rect_height > settings.GAME_AREA_HEIGHT: # Use scaled GAME_AREA_HEIGHT
-            self.position.y = settings.GAME_AREA_HEIGHT - current_rect_height
-            if not self.is_on_ground: 
-                self.is_on_ground = True
-            if self.velocity.y > 0: self.velocity.y = 0
+    def _set_anim_idx(self, anim_idx):
+        """
+        set_animation() by AnimState, for the per-frame state machine: a list index instead of a
+        dict probe by name.
+        """
+        frames = self.animations_list[anim_idx]
+        if not frames: # Missing animation: set_animation() reports it and picks a fallback
+            self.set_animation(ANIM_STATE_NAMES[anim_idx])
+        elif frames is not self.current_frames: # Otherwise already playing (e.g. selected by name)
+            self.current_animation_name = ANIM_STATE_NAMES[anim_idx]
+            self.current_frames = frames
+            self._frame_count = len(frames)
+            self.current_frame_index = 0
+            self.ticks_since_last_frame_change = 0
 
-    def update_animation(self):
-        # PLAYER_ANIMATION_VELOCITY_THRESHOLD is already scaled in settings.py
-        animation_velocity_threshold = settings.PLAYER_ANIMATION_VELOCITY_THRESHOLD
+            current_center = self.rect.center
+            self.image = frames[0]
+            self.rect.size = self.animation_sizes[self.current_animation_name]
+            self.rect.center = current_center
+        self.current_anim_idx = anim_idx
 
-        vel_x_direction = 0
-        if self.velocity.x > animation_velocity_threshold : vel_x_direction = 1
-        elif self.velocity.x < -animation_velocity_threshold: vel_x_direction = -1
-        
-        vel_y_direction = 0 
-        if self.velocity.y > animation_velocity_threshold and not self.is_on_ground : vel_y_direction = 1 
-        elif self.velocity.y < -animation_velocity_threshold: vel_y_direction = -1 
-
-        target_animation = None
-        if vel_x_direction > 0: target_animation = "walk_right"
-        elif vel_x_direction < 0: target_animation = "walk_left"
-        elif vel_y_direction != 0 : target_animation = "idle_front" 
-        else: target_animation = "idle_front"
-        
-        if target_animation and (self.current_animation_name != target_animation or not self.current_frames):
-            self.set_animation(target_animation)
+    def _platform_hash(self, platforms):
+        """
+        SpatialHash over the platforms' rects, built on first use (i.e. once the level is loaded) and
+        reused until a different group is passed or the group's size changes. Platforms are static,
+        so their positions are not re-read every frame.
+        """
+        cache = self._platform_cache
+        if cache is None or cache[0] is not platforms or cache[1] != len(platforms):
+            platform_hash = SpatialHash((p.rect for p in platforms),
+                                        settings.COLLISION_CELL_WIDTH, settings.COLLISION_CELL_HEIGHT)
+            cache = self._platform_cache = (platforms, len(platforms), platform_hash)
+        return cache[2]
 
-        if not self.current_frames:
-            if self.image is None: 
-                self.image = pygame.Surface([self.scaled_sprite_width, self.scaled_sprite_height], pygame.SRCALPHA)
-                self.image.fill((0,0,255,100)) # Blue placeholder
-                if self.rect is None: self.rect = self.image.get_rect(topleft=self.position)
+    def _step(self, dt, platforms, bottom=settings.GAME_AREA_HEIGHT):
+        """
+        One movement step: input and integration (physics.move), platform collisions
+        (SpatialHash.resolve) and screen boundaries (physics.clamp_to_bounds), with the player's state
+        written back once at the end.
+        Args:
+            dt (float): Seconds since the last frame.
+            platforms (pygame.sprite.Group): The solid platforms.
+            bottom (int): The lowest y the player's bottom edge may reach. Defaults to the bottom of
+                          the game area, so the player never walks into the info panel; pass
+                          settings.SCREEN_HEIGHT to use the whole window.
+        """
+        keys = _get_pressed()
+        dir_bits = keys[_K_LEFT] | keys[_K_RIGHT] << 1 | keys[_K_UP] << 2 | keys[_K_DOWN] << 3
+        cache = self._platform_cache
+        if (self.is_on_ground and not dir_bits and cache is not None
+                and cache[0] is platforms and cache[1] == len(platforms)):
+            # Standing on the ground with no input and the same platforms as last step: the velocity is
+            # zero and platforms are static, so the position can't change; the collision and boundary
+            # passes are skipped entirely. A changed platform set (which _platform_hash() rebuilds for)
+            # takes a full step, so the player falls if the ground went away.
+            self._vx = self._vy = 0.0
             return
 
-        self.ticks_since_last_frame_change += 1
-        if self.ticks_since_last_frame_change >= self.animation_ticks_per_frame:
-            self.ticks_since_last_frame_change = 0
-            self.current_frame_index = (self.current_frame_index + 1) % len(self.current_frames)
-            
-            if self.current_frame_index < len(self.current_frames) and self.current_frames[self.current_frame_index]:
-                new_image = self.current_frames[self.current_frame_index]
-                if self.rect is not None:
-                    old_center = self.rect.center
-                    self.image = new_image
-                    self.rect = self.image.get_rect(center=old_center)
-                else: 
-                    self.image = new_image
-                    self.rect = self.image.get_rect(topleft=self.position)
-
-    def update(self, dt, platforms):
-        self.handle_input_and_movement(dt)
+        rect = self.rect
+        speed = self.speed_pps
+        gravity = self.gravity_pps
 
-        if self.rect is None:
-            if self.image: 
-                self.rect = self.image.get_rect(topleft=(round(self.position.x), round(self.position.y)))
-            else: 
-                print("Warning: Player rect was None and image was None during update. Creating default rect.")
-                self.rect = pygame.Rect(round(self.position.x), round(self.position.y), 
-                                        self.scaled_sprite_width, self.scaled_sprite_height)
+        w, h = rect.width, rect.height
+        px, py, vx, vy = _physics_move(self._px, self._py, _DIR_X_FROM_BITS[dir_bits],
+                                       _DIR_Y_FROM_BITS[dir_bits], self.is_on_ground, speed, gravity, dt)
+        # The hash looks up the platforms near each collision pass's box, so its result is the same as
+        # testing every platform
+        px, py, vx, vy, on_ground = self._platform_hash(platforms).resolve(px, py, rect.y, w, h, vx, vy)
+        px, py, vx, vy, on_ground = _clamp_to_bounds(px, py, vx, vy, on_ground, _SCREEN_WIDTH, bottom, w, h)
 
-        self.handle_platform_collisions(platforms)
-        self.apply_screen_boundaries() # Uses scaled GAME_AREA_HEIGHT and SCREEN_WIDTH from settings
+        self._px, self._py, self._vx, self._vy, self.is_on_ground = px, py, vx, vy, on_ground
+        # Snap to pixels by truncation: the position is non-negative after the boundary clamp, so int()
+        # floors it, and it is a cheaper call than round()
+        rect.topleft = (int(px), int(py))
 
-        if self.rect is not None: 
-            self.rect.topleft = (round(self.position.x), round(self.position.y))
+    def update_animation(self):
+        vx = self._vx
+        # Comparisons are 0/1 ints, so this is -1/0/1 for left/none/right, shifted to a table index
+        target_state = _ANIM_LUT[(vx > _VEL_THR) - (vx < -_VEL_THR) + 1]
         
+        if target_state != self.current_anim_idx:
+            self._set_anim_idx(target_state)
+
+        # Nothing to advance for single-frame animations (or the fallback image when there are no frames)
+        if self._frame_count <= 1:
+            return
+
+        self.ticks_since_last_frame_change, frame_index = _tick_anim(
+            self.ticks_since_last_frame_change, self.animation_ticks_per_frame,
+            self.current_frame_index, self._frame_count)
+        if frame_index != self.current_frame_index:
+            self.current_frame_index = frame_index
+            # All frames of one animation are cut with the same width/height (see
+            # Spritesheet.get_animation_frames), so the existing rect can be kept as is.
+            self.image = self.current_frames[frame_index]
+
+    def get_blit_pair(self):
+        """The (surface, rect) pair to draw this frame, in the form Surface.fblits() takes."""
+        return self.image, self.rect
+
+    # Hot path kept monomorphic for PyPy's JIT (and numba): positions and velocities are always
+    # floats, animation states ints and frame sequences tuples, so traces stay specialized.
+    def update(self, dt, platforms):
+        self._step(dt, platforms)
         self.update_animation()
@@ -21,6 +21,14 @@ GLOBAL_SCALE_FACTOR = 3
 SCREEN_WIDTH = BASE_SCREEN_WIDTH * GLOBAL_SCALE_FACTOR       # 320 * 3 = 960
 SCREEN_HEIGHT = BASE_SCREEN_HEIGHT * GLOBAL_SCALE_FACTOR     # 200 * 3 = 600
 FPS = 60 # Frames per second
+# VSync for the display: 0 = off, so clock.tick(FPS) alone paces the game loop and presenting a frame never
+# blocks on the monitor's refresh. 1 = on (pygame only honours it together with the SCALED or OPENGL flags).
+VSYNC = 0
+# Frame pacing: False = sleep between frames (low CPU use), True = busy-wait for steadier frame times / dt
+PRECISE_PACING = False
+# Run a full garbage collection every N frames with the automatic collector disabled (0 = leave Python's/PyPy's
+# automatic GC on). The game loop creates almost no reference cycles, so collecting rarely is safe.
+GC_COLLECT_INTERVAL_FRAMES = 600
 
 # --- Game Layout Dimensions (Derived from base and scale factor) ---
 GAME_AREA_WIDTH = BASE_GAME_AREA_WIDTH * GLOBAL_SCALE_FACTOR    # 320 * 3 = 960
@@ -35,6 +43,10 @@ BASE_TILE_HEIGHT = BASE_GAME_AREA_HEIGHT // 18 # Should be 8 (144 / 18)
 # Scaled tile size for rendering in the Pygame window
 TILE_WIDTH = BASE_TILE_WIDTH * GLOBAL_SCALE_FACTOR      # 8 * 3 = 24
 TILE_HEIGHT = BASE_TILE_HEIGHT * GLOBAL_SCALE_FACTOR    # 8 * 3 = 24
+# Cell size of the platform collision grid (see spatial_hash.py): whole tiles, so cells line up with the
+# tile-based platforms, and about one player sprite across, so a collision query only touches a few cells
+COLLISION_CELL_WIDTH = TILE_WIDTH * 3
+COLLISION_CELL_HEIGHT = TILE_HEIGHT * 3
 
 
 # Colors (RGB)
@@ -0,0 +1,77 @@
+# spatial_hash.py
+
+import pygame
+from collision_kernels import pack_aabbs, select_aabbs, resolve, resolve_x, resolve_y
+
+# Up to this many rects, query_aabbs() hands back all of them (and resolve() scans them in one kernel call):
+# the collision kernel's straight scan over a few contiguous rows is cheaper than the cell lookups, set and
+# sort of a grid query.
+LINEAR_SCAN_MAX_RECTS = 16
+
+class SpatialHash:
+    """
+    Uniform grid over static rects (e.g. platforms), so collision checks only look at the rects
+    near the player instead of scanning all of them.
+    """
+    def __init__(self, rects, cell_width=64, cell_height=None):
+        """
+        Buckets the rects into grid cells. Build it once when the level is set up; the rects are
+        assumed not to move afterwards.
+        Args:
+            rects (iterable of pygame.Rect): The rects to index.
+            cell_width (int, optional): Width of a grid cell in pixels. Defaults to 64.
+            cell_height (int, optional): Height of a grid cell in pixels. Defaults to cell_width.
+        """
+        self.cell_width = cell_width
+        self.cell_height = cell_height or cell_width
+        self.rects = list(rects)
+        self.aabbs = pack_aabbs(self.rects) # All rects packed for collision_kernels.resolve()
+        self.cells = {} # (cell_x, cell_y) -> indices into self.rects, ascending
+        for index, rect in enumerate(self.rects):
+            for cell in self._cells_overlapping(rect):
+                self.cells.setdefault(cell, []).append(index)
+
+    def _cells_overlapping(self, rect):
+        cell_w, cell_h = self.cell_width, self.cell_height
+        # right/bottom are exclusive, so the last covered pixel is right - 1 / bottom - 1
+        for cell_y in range(rect.top // cell_h, (rect.bottom - 1) // cell_h + 1):
+            for cell_x in range(rect.left // cell_w, (rect.right - 1) // cell_w + 1):
+                yield cell_x, cell_y
+
+    def query(self, rect):
+        """
+        Indices of the rects sharing at least one grid cell with `rect`, in ascending order (the
+        order of the full list). Every rect overlapping `rect` is included; candidates may not
+        actually overlap it.
+        """
+        cells = self.cells
+        hits = set()
+        for cell in self._cells_overlapping(rect):
+            indices = cells.get(cell)
+            if indices:
+                hits.update(indices)
+        return sorted(hits)
+
+    def query_aabbs(self, rect):
+        """
+        The packed AABBs (see collision_kernels.pack_aabbs) of the rects query() returns, or of all rects
+        when there are no more than LINEAR_SCAN_MAX_RECTS of them.
+        """
+        if len(self.rects) <= LINEAR_SCAN_MAX_RECTS:
+            return self.aabbs
+        return select_aabbs(self.aabbs, self.query(rect))
+
+    def resolve(self, px, py, rect_y, w, h, vx, vy):
+        """
+        collision_kernels.resolve() against the hashed rects, with the same result as resolving against
+        all of them. Each axis pass gets the rects near the exact box it tests: the horizontal pass the
+        box at (int(px), rect_y), the vertical pass the box at the pushed-out x and int(py). (The
+        pushed-out x is only known after the first pass, so one query over both would have to cover an
+        unbounded area.)
+        Returns (px, py, vx, vy, on_ground).
+        """
+        if len(self.rects) <= LINEAR_SCAN_MAX_RECTS:
+            return resolve(self.aabbs, px, py, rect_y, w, h, vx, vy)
+        x, px, vx = resolve_x(self.query_aabbs(pygame.Rect(int(px), rect_y, w, h)), px, rect_y, w, h, vx)
+        py, vy, on_ground = resolve_y(self.query_aabbs(pygame.Rect(x, int(py), w, h)), x, py, w, h, vy)
+        return px, py, vx, vy, on_ground
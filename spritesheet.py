@@ -20,6 +20,9 @@ class Spritesheet:
             print(f"Unable to load spritesheet image: {filename} (abs path: {abs_path})")
             print(f"Pygame Error: {e}")
             raise SystemExit(e)
+        # Extracted frames keyed by (x, y, width, height, scale), so frames shared between animations
+        # (or requested again by another Player) are only cut and scaled once
+        self._frame_cache = {}
 
     def get_image(self, x, y, width, height, scale=None):
         """
@@ -33,13 +36,25 @@ class Spritesheet:
         Returns:
             pygame.Surface: The extracted (and optionally scaled) image.
         """
-        image = pygame.Surface([width, height], pygame.SRCALPHA) # Use SRCALPHA for transparency
-        image.blit(self.sheet, (0, 0), (x, y, width, height))
+        key = (x, y, width, height, scale)
+        cached = self._frame_cache.get(key)
+        if cached is not None:
+            return cached
+
+        region = pygame.Rect(x, y, width, height)
+        if self.sheet.get_rect().contains(region):
+            image = self.sheet.subsurface(region) # A view into the sheet, no copy
+        else:
+            # Partly outside the sheet (subsurface would raise): copy what overlaps onto a transparent frame
+            image = pygame.Surface([width, height], pygame.SRCALPHA) # Use SRCALPHA for transparency
+            image.blit(self.sheet, (0, 0), region)
         if scale:
-            # Ensure dimensions are integers after scaling for transform.scale
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            image = pygame.transform.scale(image, (new_width, new_height))
+            # Nearest-neighbour scale straight from the view (scale_by truncates the new size to ints)
+            image = pygame.transform.scale_by(image, scale)
+        # Convert to the display's pixel format (keeping per-pixel alpha) so blits don't translate formats every frame.
+        # This also makes an unscaled frame an independent copy instead of a view into the sheet.
+        image = image.convert_alpha()
+        self._frame_cache[key] = image
         return image
 
     def get_animation_frames(self, start_x, y, frame_width, frame_height, num_frames, spacing=0, scale=None):
@@ -0,0 +1,97 @@
+# tests/test_player.py
+
+# Run from the repository root: python -m unittest discover -s tests
+
+import collections
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import player
+import settings
+from game_platform import Platform
+from player import Player
+from spritesheet import Spritesheet
+
+def setUpModule():
+    global spritesheet
+    pygame.init()
+    pygame.display.set_mode((1, 1)) # convert_alpha() needs a display surface
+    spritesheet = Spritesheet(os.path.join(ROOT, settings.SPRITESHEET_FILENAME))
+
+def tearDownModule():
+    pygame.quit()
+
+def _walk_right():
+    return {"x": 200, "y": 75, "w": settings.PLAYER_SPRITE_WIDTH, "h": settings.PLAYER_SPRITE_HEIGHT,
+            "count": 4, "spacing": 1}
+
+def _pixels(frames):
+    return [pygame.image.tobytes(frame, "RGBA") for frame in frames]
+
+def _flipped(frames):
+    return [pygame.transform.flip(frame, True, False) for frame in frames]
+
+class MirrorFromTest(unittest.TestCase):
+
+    def _load(self, animation_frames_data):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            wizard = Player(spritesheet, animation_frames_data, "walk_right")
+        return wizard, output.getvalue()
+
+    def test_mirror(self):
+        wizard, _ = self._load({"walk_left": {"mirror_from": "walk_right"}, "walk_right": _walk_right()})
+        frames = wizard.animations["walk_left"]
+        size = (settings.PLAYER_SPRITE_WIDTH * settings.GLOBAL_SCALE_FACTOR,
+                settings.PLAYER_SPRITE_HEIGHT * settings.GLOBAL_SCALE_FACTOR)
+        self.assertEqual(len(frames), 4)
+        self.assertEqual(wizard.animation_sizes["walk_left"], size)
+        self.assertEqual([frame.get_size() for frame in frames], [size] * 4)
+        self.assertEqual(_pixels(frames), _pixels(_flipped(wizard.animations["walk_right"])))
+
+    def test_mirror_of_mirror_listed_first(self):
+        wizard, _ = self._load({"twice": {"mirror_from": "once"}, "once": {"mirror_from": "walk_right"},
+                                "walk_right": _walk_right()})
+        self.assertEqual(len(wizard.animations["twice"]), 4)
+        self.assertEqual(_pixels(wizard.animations["twice"]), _pixels(wizard.animations["walk_right"]))
+
+    def test_unknown_source_is_named(self):
+        wizard, output = self._load({"walk_right": _walk_right(), "walk_left": {"mirror_from": "walk_rihgt"}})
+        self.assertEqual(wizard.animations["walk_left"], ())
+        self.assertIn("'walk_rihgt'", output)
+
+class IdleStepTest(unittest.TestCase):
+
+    def setUp(self):
+        # No keys held
+        self._get_pressed = player._get_pressed
+        player._get_pressed = lambda: collections.defaultdict(int)
+
+    def tearDown(self):
+        player._get_pressed = self._get_pressed
+
+    def test_platform_removed_under_idle_player(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            wizard = Player(spritesheet, {"walk_right": _walk_right()}, "walk_right", position=(100, 0))
+        platforms = pygame.sprite.Group(Platform(0, 150, 400, 24))
+        for _ in range(60):
+            wizard.update(1 / 60, platforms)
+        self.assertTrue(wizard.is_on_ground)
+        self.assertEqual(wizard.rect.bottom, 150)
+
+        platforms.empty()
+        for _ in range(60):
+            wizard.update(1 / 60, platforms)
+        # Fell through to the bottom of the game area
+        self.assertEqual(wizard.rect.bottom, settings.GAME_AREA_HEIGHT)
+
+if __name__ == '__main__':
+    unittest.main()
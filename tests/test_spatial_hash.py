@@ -0,0 +1,49 @@
+# tests/test_spatial_hash.py
+
+# Run from the repository root: python -m unittest discover -s tests
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import pygame
+import spatial_hash
+from collision_kernels import resolve
+from spatial_hash import SpatialHash
+
+class SpatialHashResolveTest(unittest.TestCase):
+    """SpatialHash.resolve() must give the same result as collision_kernels.resolve() over all rects."""
+
+    def setUp(self):
+        # Always take the grid path, whatever the number of rects
+        self._linear_scan_max = spatial_hash.LINEAR_SCAN_MAX_RECTS
+        spatial_hash.LINEAR_SCAN_MAX_RECTS = 0
+
+    def tearDown(self):
+        spatial_hash.LINEAR_SCAN_MAX_RECTS = self._linear_scan_max
+
+    def _check_against_full_scan(self, rect_count, seed):
+        rng = random.Random(seed)
+        rects = [pygame.Rect(rng.randrange(0, 960), rng.randrange(0, 600),
+                             rng.randrange(16, 200), rng.randrange(8, 40)) for _ in range(rect_count)]
+        platform_hash = SpatialHash(rects, 64, 48)
+        w, h = 72, 72
+        for _ in range(3000):
+            # Boxes anywhere, including embedded in rects and far from their last drawn y (teleports)
+            px, py = rng.uniform(-50, 1000), rng.uniform(-50, 650)
+            rect_y = int(py) + rng.choice((0, rng.randrange(-300, 300)))
+            vx, vy = rng.choice((-240.0, 0.0, 240.0)), rng.choice((-240.0, 0.0, 480.0))
+            self.assertEqual(platform_hash.resolve(px, py, rect_y, w, h, vx, vy),
+                             resolve(platform_hash.aabbs, px, py, rect_y, w, h, vx, vy))
+
+    def test_matches_full_scan(self):
+        self._check_against_full_scan(200, 1)
+
+    def test_matches_full_scan_dense(self):
+        self._check_against_full_scan(600, 2)
+
+if __name__ == '__main__':
+    unittest.main()